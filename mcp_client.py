@@ -4,40 +4,231 @@ Comprehensive MCP client to connect to the Travel & Content Search MCP Server
 Supports Flight, TripAdvisor, and YouTube search functionality
 """
 
-import json
-import requests
+import datetime
+import itertools
+import orjson
+import re
 import sys
-from typing import Dict, Any, Optional
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+# On-disk cache of the tools/list response, reused across client runs
+TOOLS_CACHE_PATH = Path("~/.cache/travel_mcp/tools.json").expanduser()
+TOOLS_CACHE_TTL = 600
+
+# Shortest accepted city, airport code or location name
+MIN_LOCATION_LENGTH = 2
+
+# Accepted values for the optional YouTube search filters
+YT_DURATIONS = frozenset({"short", "medium", "long"})
+YT_UPLOAD_DATES = frozenset({"hour", "today", "week", "month", "year"})
+YT_SORT_BY = frozenset({"relevance", "upload_date", "view_count", "rating"})
 
 class TravelMcpClient:
-    def __init__(self, server_url: str = "http://localhost:8080/mcp"):
+    def __init__(self, server_url: str = "http://localhost:8080/mcp",
+                 cache_ttl: float = 300, cache_size: int = 128):
         self.server_url = server_url
-        self.session = requests.Session()
+        # LRU cache of successful responses: (method, canonical params) -> (stored_at, response)
+        self._cache: "OrderedDict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        # Unique JSON-RPC ids, so concurrent and batched calls never collide
+        self._ids = itertools.count(1)
+        # HTTP session and transport error types, created on first use so startup skips importing requests
+        self.session = None
+        self._http_errors: Tuple[type, ...] = ()
+    
+    def _http(self) -> Tuple[Any, Tuple[type, ...]]:
+        """Return the pooled HTTP session and the transport errors it raises, creating them on first use"""
+        if self.session is None:
+            import requests
+            import urllib3
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            # One long-lived MCP endpoint: keep connections alive and retry transient gateway errors
+            adapter = HTTPAdapter(
+                pool_connections=2,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["POST"]
+                )
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers.update({
+                "Content-Type": "application/json",
+                "Connection": "keep-alive"
+            })
+            # urllib3 errors can escape requests while reading a streamed body
+            self._http_errors = (requests.exceptions.RequestException, urllib3.exceptions.HTTPError)
+            self.session = session
+        return self.session, self._http_errors
+    
+    def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Send a JSON-RPC 2.0 request to the MCP server, reusing recent identical responses"""
+        key = self._cache_key(method, params)
+        result = self._cache_get(key)
+        if result is None:
+            result = self._post(method, params)
+            self._cache_put(key, result)
+        return result
+    
+    @staticmethod
+    def _cache_key(method: str, params: Optional[Dict[str, Any]]) -> Tuple[str, bytes]:
+        """Cache key for a call: method plus canonical (sorted-key) params"""
+        return (method, orjson.dumps(params or {}, option=orjson.OPT_SORT_KEYS))
+    
+    def _cache_get(self, key: Tuple[str, bytes]) -> Optional[Dict[str, Any]]:
+        """Return a cached response that is still within the TTL"""
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+        stored_at, result = cached
+        if time.monotonic() - stored_at < self._cache_ttl:
+            self._cache.move_to_end(key)
+            return result
+        del self._cache[key]
+        return None
+    
+    def _cache_put(self, key: Tuple[str, bytes], result: Dict[str, Any]):
+        """Cache a successful response, evicting the least recently used entry when full"""
+        if "error" in result:
+            return
+        self._cache[key] = (time.monotonic(), result)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
     
-    def send_request(self, method: str, params: Dict[str, Any] = None, request_id: int = 1) -> Dict[str, Any]:
-        """Send a JSON-RPC 2.0 request to the MCP server"""
+    def _payload(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build a JSON-RPC 2.0 request object with a fresh request id"""
         payload = {
             "jsonrpc": "2.0",
-            "id": request_id,
+            "id": next(self._ids),
             "method": method
         }
         if params:
             payload["params"] = params
+        return payload
+    
+    def _post(self, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """POST a single JSON-RPC 2.0 request without consulting the cache"""
+        session, http_errors = self._http()
+        payload = self._payload(method, params)
         
         try:
-            response = self.session.post(
-                self.server_url,
-                json=payload,
-                headers={"Content-Type": "application/json"}
-            )
+            response = session.post(self.server_url, data=orjson.dumps(payload))
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (*http_errors, orjson.JSONDecodeError) as e:
+            return {"error": f"Request failed: {e}"}
+    
+    def send_request_stream(self, method: str, params: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """Send a JSON-RPC 2.0 request and yield result content items as they are parsed.
+        
+        Library API for callers consuming responses with many content items; the interactive
+        menu uses send_request, since the bundled tools return a single text item. Needs ijson.
+        Responses are not cached; a JSON-RPC or transport error is yielded as a single
+        {"error": ...} item.
+        """
+        import ijson
+        
+        session, http_errors = self._http()
+        payload = self._payload(method, params)
+        
+        try:
+            with session.post(self.server_url, data=orjson.dumps(payload), stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                builder = None
+                for prefix, event, value in ijson.parse(response.raw, use_float=True):
+                    if builder is None:
+                        if prefix not in ("result.content.item", "error") or event in ("map_key", "end_map", "end_array"):
+                            continue
+                        builder, root, depth = ijson.ObjectBuilder(), prefix, 0
+                    builder.event(event, value)
+                    if event in ("start_map", "start_array"):
+                        depth += 1
+                    elif event in ("end_map", "end_array"):
+                        depth -= 1
+                    if depth == 0:
+                        yield {"error": builder.value} if root == "error" else builder.value
+                        builder = None
+        except (*http_errors, ijson.JSONError) as e:
+            yield {"error": f"Request failed: {e}"}
+    
+    def clear_cache(self):
+        """Drop all cached responses"""
+        self._cache.clear()
+    
+    def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Send several JSON-RPC 2.0 requests in a single batch, returning responses in call order.
+        
+        Cached calls are answered locally and only the misses are batched. Servers that reject
+        batches get the misses as individual requests sent concurrently.
+        """
+        keys = [self._cache_key(method, params) for method, params in calls]
+        results = [self._cache_get(key) for key in keys]
+        misses = [i for i, result in enumerate(results) if result is None]
+        if not misses:
+            return results
+        
+        for i, result in zip(misses, self._send_batch_uncached([calls[i] for i in misses])):
+            results[i] = result
+            self._cache_put(keys[i], result)
+        return results
+    
+    def _send_batch_uncached(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """POST calls as one JSON-RPC 2.0 batch without consulting the cache"""
+        session, http_errors = self._http()
+        payload = [self._payload(method, params) for method, params in calls]
+        
+        try:
+            response = session.post(self.server_url, data=orjson.dumps(payload))
+            if response.status_code == 400:
+                # Older /mcp endpoints only bind a single request object
+                return self._send_concurrently(calls)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+        except (*http_errors, orjson.JSONDecodeError) as e:
+            return [{"error": f"Request failed: {e}"} for _ in calls]
+        
+        if not isinstance(data, list):
+            return self._send_concurrently(calls)
+        by_id = {item.get("id"): item for item in data}
+        return [
+            by_id.get(request["id"]) or {"error": "No response received for batched call"}
+            for request in payload
+        ]
+    
+    def _send_concurrently(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Send each call as its own request, in parallel over the pooled session"""
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            return list(executor.map(lambda call: self.send_request(*call), calls))
+    
+    def ping(self) -> Dict[str, Any]:
+        """Check that the server is reachable without running an MCP method"""
+        session, http_errors = self._http()
+        
+        try:
+            response = session.head(self.server_url)
+        except http_errors as e:
             return {"error": f"Request failed: {e}"}
+        
+        # /mcp only serves POST, so a live MCP server answers HEAD with 405 (or 2xx behind a proxy)
+        if response.status_code == 405 or 200 <= response.status_code < 300:
+            return {"result": {"status": response.status_code}}
+        return {"error": f"Unexpected HTTP {response.status_code} from {self.server_url}"}
     
     def list_tools(self) -> Dict[str, Any]:
         """List available tools"""
-        return self.send_request("tools/list", request_id=1)
+        return self.send_request("tools/list")
     
     def search_flights(self, departure: str, arrival: str, date: str) -> Dict[str, Any]:
         """Search for flights"""
@@ -48,7 +239,7 @@ class TravelMcpClient:
                 "arrival": arrival,
                 "date": date
             }
-        }, request_id=2)
+        })
     
     def search_hotels(self, location: str, check_in: str, check_out: str, adults: int = 2) -> Dict[str, Any]:
         """Search for hotels"""
@@ -60,7 +251,7 @@ class TravelMcpClient:
                 "checkOut": check_out,
                 "adults": adults
             }
-        }, request_id=3)
+        })
     
     def search_restaurants(self, location: str, cuisine: Optional[str] = None) -> Dict[str, Any]:
         """Search for restaurants"""
@@ -71,7 +262,7 @@ class TravelMcpClient:
         return self.send_request("tools/call", {
             "name": "search_restaurants",
             "arguments": arguments
-        }, request_id=4)
+        })
     
     def search_attractions(self, location: str, category: Optional[str] = None) -> Dict[str, Any]:
         """Search for attractions"""
@@ -82,7 +273,7 @@ class TravelMcpClient:
         return self.send_request("tools/call", {
             "name": "search_attractions",
             "arguments": arguments
-        }, request_id=5)
+        })
     
     def search_youtube_videos(self, query: str, duration: Optional[str] = None, 
                              upload_date: Optional[str] = None, sort_by: Optional[str] = None,
@@ -99,43 +290,138 @@ class TravelMcpClient:
         return self.send_request("tools/call", {
             "name": "search_youtube_videos",
             "arguments": arguments
-        }, request_id=6)
+        })
+    
+    def search_trip(self, departure: str, destination: str, start_date: str, end_date: str,
+                    adults: int = 2) -> Dict[str, Dict[str, Any]]:
+        """Search flights, hotels, restaurants and attractions for one trip in a single batch"""
+        calls = [
+            ("flights", "search_flights", {
+                "departure": departure,
+                "arrival": destination,
+                "date": start_date
+            }),
+            ("hotels", "search_hotels", {
+                "location": destination,
+                "checkIn": start_date,
+                "checkOut": end_date,
+                "adults": adults
+            }),
+            ("restaurants", "search_restaurants", {"location": destination}),
+            ("attractions", "search_attractions", {"location": destination})
+        ]
+        results = self.send_batch([
+            ("tools/call", {"name": tool, "arguments": arguments})
+            for _, tool, arguments in calls
+        ])
+        return {key: result for (key, _, _), result in zip(calls, results)}
+
+# Separator lines used in menu and result output
+SEP60_DASH = "-" * 60
+SEP60_EQ = "=" * 60
+
+# Display order for the combined trip search
+TRIP_SERVICES = [
+    ("flights", "✈️", "Flight"),
+    ("hotels", "🏨", "Hotel"),
+    ("restaurants", "🍽️", "Restaurant"),
+    ("attractions", "🎭", "Attraction")
+]
+
+def write_output(parts: List[bytes]):
+    """Write a block of UTF-8 output to stdout in one go"""
+    sys.stdout.flush()
+    sys.stdout.buffer.writelines(parts)
+    sys.stdout.buffer.flush()
+
+def _results_header(service_emoji: str, service_name: str) -> bytes:
+    """Banner printed above a service's results"""
+    return f"\n{service_emoji} {service_name} Results:\n{SEP60_DASH}\n".encode()
+
+def format_text_content(text: str) -> bytes:
+    """Pretty-print a text content block as UTF-8, indenting it when it holds JSON"""
+    # Already pretty-printed JSON (e.g. YouTube results) is shown as-is rather than parsed and re-dumped
+    if text.startswith(("{", "[")) and "\n  " in text[:200]:
+        return text.encode()
+    try:
+        data = orjson.loads(text)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONDecodeError:
+        return text.encode()
 
 def display_result(result: Dict[str, Any], service_emoji: str, service_name: str):
     """Display search results in a consistent format"""
     if "result" in result and "content" in result["result"]:
-        print(f"\n{service_emoji} {service_name} Results:")
-        print("-" * 60)
+        parts = [_results_header(service_emoji, service_name)]
         for content in result["result"]["content"]:
             if content.get("type") == "text":
                 # Try to format JSON nicely
-                try:
-                    data = json.loads(content["text"])
-                    print(json.dumps(data, indent=2, ensure_ascii=False))
-                except json.JSONDecodeError:
-                    print(content["text"])
+                parts.append(format_text_content(content["text"]))
+                parts.append(b"\n")
     elif "result" in result:
-        print(f"\n{service_emoji} {service_name} Results:")
-        print("-" * 60)
-        print(result["result"])
+        parts = [_results_header(service_emoji, service_name), f"{result['result']}\n".encode()]
     else:
-        print(f"\n❌ Error: {result}")
+        parts = [f"\n❌ Error: {result}\n".encode()]
+    write_output(parts)
+
+def _valid_date(value: str) -> bool:
+    """Check for a real calendar date in YYYY-MM-DD form"""
+    if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+        return False
+    try:
+        datetime.date.fromisoformat(value)
+        return True
+    except ValueError:
+        return False
+
+def _valid_location(value: str) -> bool:
+    """Check that a city/airport/location is long enough to be searchable"""
+    return len(value) >= MIN_LOCATION_LENGTH
+
+def _parse_adults(value: str) -> Optional[int]:
+    """Parse the number of adults (1-9, default 2); None when invalid"""
+    if not value:
+        return 2
+    if value.isdecimal() and 1 <= int(value) <= 9:
+        return int(value)
+    return None
+
+def _prompts(fields: List[Tuple[str, str]], required: Tuple[str, ...] = ()) -> Optional[Dict[str, str]]:
+    """Collect stripped answers for (key, prompt) pairs; None when a required answer is empty.
+    
+    On a terminal an empty required answer cancels straight away. Piped stdin is read one line
+    per field without drawing prompts, so a script always consumes the same number of lines.
+    """
+    interactive = sys.stdin.isatty()
+    answers = {}
+    for key, prompt in fields:
+        answers[key] = (input(prompt) if interactive else sys.stdin.readline()).strip()
+        if interactive and key in required and not answers[key]:
+            return None
+    if not all(answers[key] for key in required):
+        return None
+    return answers
 
 def handle_flight_search(client: TravelMcpClient):
     """Handle flight search interaction"""
     print("\n✈️ Flight Search")
     print("=" * 30)
     
-    departure = input("Departure city/airport: ").strip()
-    if not departure:
+    vals = _prompts([
+        ("departure", "Departure city/airport: "),
+        ("arrival", "Arrival city/airport: "),
+        ("date", "Date (YYYY-MM-DD): ")
+    ], required=("departure", "arrival", "date"))
+    if vals is None:
         return
-        
-    arrival = input("Arrival city/airport: ").strip()
-    if not arrival:
+    
+    departure, arrival, date = vals["departure"], vals["arrival"], vals["date"]
+    
+    if not (_valid_location(departure) and _valid_location(arrival)):
+        print(f"\n❌ Departure and arrival must be at least {MIN_LOCATION_LENGTH} characters.")
         return
-        
-    date = input("Date (YYYY-MM-DD): ").strip()
-    if not date:
+    if not _valid_date(date):
+        print(f"\n❌ Invalid date '{date}'. Use YYYY-MM-DD.")
         return
     
     print(f"\n🔍 Searching flights from {departure} to {arrival} on {date}...")
@@ -147,20 +433,30 @@ def handle_hotel_search(client: TravelMcpClient):
     print("\n🏨 Hotel Search")
     print("=" * 30)
     
-    location = input("Location: ").strip()
-    if not location:
+    vals = _prompts([
+        ("location", "Location: "),
+        ("check_in", "Check-in date (YYYY-MM-DD): "),
+        ("check_out", "Check-out date (YYYY-MM-DD): "),
+        ("adults", "Number of adults (default: 2): ")
+    ], required=("location", "check_in", "check_out"))
+    if vals is None:
         return
-        
-    check_in = input("Check-in date (YYYY-MM-DD): ").strip()
-    if not check_in:
+    
+    location, check_in, check_out = vals["location"], vals["check_in"], vals["check_out"]
+    adults = _parse_adults(vals["adults"])
+    
+    if not _valid_location(location):
+        print(f"\n❌ Location must be at least {MIN_LOCATION_LENGTH} characters.")
         return
-        
-    check_out = input("Check-out date (YYYY-MM-DD): ").strip()
-    if not check_out:
+    if not (_valid_date(check_in) and _valid_date(check_out)):
+        print("\n❌ Invalid check-in or check-out date. Use YYYY-MM-DD.")
+        return
+    if check_out <= check_in:
+        print("\n❌ Check-out date must be after check-in date.")
+        return
+    if adults is None:
+        print("\n❌ Number of adults must be between 1 and 9.")
         return
-    
-    adults_input = input("Number of adults (default: 2): ").strip()
-    adults = int(adults_input) if adults_input.isdigit() else 2
     
     print(f"\n🔍 Searching hotels in {location} for {adults} adults...")
     result = client.search_hotels(location, check_in, check_out, adults)
@@ -171,12 +467,19 @@ def handle_restaurant_search(client: TravelMcpClient):
     print("\n🍽️ Restaurant Search")
     print("=" * 30)
     
-    location = input("Location: ").strip()
-    if not location:
+    vals = _prompts([
+        ("location", "Location: "),
+        ("cuisine", "Cuisine (optional): ")
+    ], required=("location",))
+    if vals is None:
         return
         
-    cuisine = input("Cuisine (optional): ").strip()
-    cuisine = cuisine if cuisine else None
+    location = vals["location"]
+    cuisine = vals["cuisine"] or None
+    
+    if not _valid_location(location):
+        print(f"\n❌ Location must be at least {MIN_LOCATION_LENGTH} characters.")
+        return
     
     print(f"\n🔍 Searching restaurants in {location}...")
     result = client.search_restaurants(location, cuisine)
@@ -187,12 +490,19 @@ def handle_attraction_search(client: TravelMcpClient):
     print("\n🎭 Attraction Search")
     print("=" * 30)
     
-    location = input("Location: ").strip()
-    if not location:
+    vals = _prompts([
+        ("location", "Location: "),
+        ("category", "Category (optional, e.g., museums, parks, tours): ")
+    ], required=("location",))
+    if vals is None:
         return
         
-    category = input("Category (optional, e.g., museums, parks, tours): ").strip()
-    category = category if category else None
+    location = vals["location"]
+    category = vals["category"] or None
+    
+    if not _valid_location(location):
+        print(f"\n❌ Location must be at least {MIN_LOCATION_LENGTH} characters.")
+        return
     
     print(f"\n🔍 Searching attractions in {location}...")
     result = client.search_attractions(location, category)
@@ -203,41 +513,125 @@ def handle_youtube_search(client: TravelMcpClient):
     print("\n📺 YouTube Video Search")
     print("=" * 30)
     
-    query = input("Search query: ").strip()
-    if not query:
+    vals = _prompts([
+        ("query", "Search query: "),
+        ("duration", "\nOptional filters:\nDuration (short/medium/long): "),
+        ("upload_date", "Upload date (hour/today/week/month/year): "),
+        ("sort_by", "Sort by (relevance/upload_date/view_count/rating): "),
+        ("max_results", "Max results (1-50, default: 20): ")
+    ], required=("query",))
+    if vals is None:
         return
     
-    print("\nOptional filters:")
-    duration = input("Duration (short/medium/long): ").strip()
-    duration = duration if duration in ["short", "medium", "long"] else None
+    query = vals["query"]
+    duration = vals["duration"] if vals["duration"] in YT_DURATIONS else None
+    upload_date = vals["upload_date"] if vals["upload_date"] in YT_UPLOAD_DATES else None
+    sort_by = vals["sort_by"] if vals["sort_by"] in YT_SORT_BY else None
     
-    upload_date = input("Upload date (hour/today/week/month/year): ").strip()
-    upload_date = upload_date if upload_date in ["hour", "today", "week", "month", "year"] else None
-    
-    sort_by = input("Sort by (relevance/upload_date/view_count/rating): ").strip()
-    sort_by = sort_by if sort_by in ["relevance", "upload_date", "view_count", "rating"] else None
-    
-    max_results_input = input("Max results (1-50, default: 20): ").strip()
-    max_results = int(max_results_input) if max_results_input.isdigit() and 1 <= int(max_results_input) <= 50 else 20
+    max_results_input = vals["max_results"]
+    max_results = int(max_results_input) if max_results_input.isdecimal() and 1 <= int(max_results_input) <= 50 else 20
     
     print(f"\n🔍 Searching YouTube videos for '{query}'...")
     result = client.search_youtube_videos(query, duration, upload_date, sort_by, max_results)
     display_result(result, "📺", "YouTube")
 
+def handle_trip_search(client: TravelMcpClient):
+    """Handle combined trip search interaction"""
+    print("\n🧳 Trip Planner")
+    print("=" * 30)
+    
+    vals = _prompts([
+        ("departure", "Departure city/airport: "),
+        ("destination", "Destination city/airport: "),
+        ("start_date", "Start date (YYYY-MM-DD): "),
+        ("end_date", "End date (YYYY-MM-DD): "),
+        ("adults", "Number of adults (default: 2): ")
+    ], required=("departure", "destination", "start_date", "end_date"))
+    if vals is None:
+        return
+    
+    departure, destination = vals["departure"], vals["destination"]
+    start_date, end_date = vals["start_date"], vals["end_date"]
+    adults = _parse_adults(vals["adults"])
+    
+    if not (_valid_location(departure) and _valid_location(destination)):
+        print(f"\n❌ Departure and destination must be at least {MIN_LOCATION_LENGTH} characters.")
+        return
+    if not (_valid_date(start_date) and _valid_date(end_date)):
+        print("\n❌ Invalid start or end date. Use YYYY-MM-DD.")
+        return
+    if end_date <= start_date:
+        print("\n❌ End date must be after start date.")
+        return
+    if adults is None:
+        print("\n❌ Number of adults must be between 1 and 9.")
+        return
+    
+    print(f"\n🔍 Planning trip from {departure} to {destination} ({start_date} - {end_date})...")
+    results = client.search_trip(departure, destination, start_date, end_date, adults)
+    for key, emoji, name in TRIP_SERVICES:
+        display_result(results[key], emoji, name)
+
+# Menu choice -> (handler, emoji, label) for each search service
+HANDLERS = {
+    "1": (handle_flight_search, "✈️", "Flight Search"),
+    "2": (handle_hotel_search, "🏨", "Hotel Search"),
+    "3": (handle_restaurant_search, "🍽️", "Restaurant Search"),
+    "4": (handle_attraction_search, "🎭", "Attraction Search"),
+    "5": (handle_youtube_search, "📺", "YouTube Video Search"),
+    "8": (handle_trip_search, "🧳", "Trip Planner (combined search)")
+}
+# Fixed choices keep their original numbers so existing scripts still work
+LIST_TOOLS_CHOICE = "6"
+EXIT_CHOICE = "7"
+LAST_CHOICE = max([*HANDLERS, LIST_TOOLS_CHOICE, EXIT_CHOICE], key=int)
+
 def display_menu():
     """Display the main menu"""
-    print("\n" + "="*60)
-    print("🌍 Travel & Content Search MCP Client")
-    print("="*60)
-    print("Choose a service:")
-    print("1. ✈️  Flight Search")
-    print("2. 🏨  Hotel Search")
-    print("3. 🍽️  Restaurant Search") 
-    print("4. 🎭  Attraction Search")
-    print("5. 📺  YouTube Video Search")
-    print("6. 🔧  List Available Tools")
-    print("7. 🚪  Exit")
-    print("="*60)
+    lines = [
+        "",
+        SEP60_EQ,
+        "🌍 Travel & Content Search MCP Client",
+        SEP60_EQ,
+        "Choose a service:"
+    ]
+    entries = {choice: (emoji, label) for choice, (_, emoji, label) in HANDLERS.items()}
+    entries[LIST_TOOLS_CHOICE] = ("🔧", "List Available Tools")
+    entries[EXIT_CHOICE] = ("🚪", "Exit")
+    for choice in sorted(entries, key=int):
+        emoji, label = entries[choice]
+        lines.append(f"{choice}. {emoji}  {label}")
+    lines.append(SEP60_EQ)
+    write_output([("\n".join(lines) + "\n").encode()])
+
+def display_tools(tools_response: Dict[str, Any]):
+    """Display the tools advertised by the server"""
+    lines = ["", "🔧 Available Tools:", "-" * 50]
+    if "result" in tools_response and "tools" in tools_response["result"]:
+        for i, tool in enumerate(tools_response["result"]["tools"], 1):
+            lines.append(f"{i}. {tool['name']}")
+            lines.append(f"   Description: {tool['description']}")
+            lines.append("")
+    else:
+        lines.append(f"❌ Error listing tools: {tools_response}")
+    write_output([("\n".join(lines) + "\n").encode()])
+
+def load_cached_tools() -> Optional[Dict[str, Any]]:
+    """Return the cached tools/list response if it is fresh enough"""
+    try:
+        if time.time() - TOOLS_CACHE_PATH.stat().st_mtime > TOOLS_CACHE_TTL:
+            return None
+        return orjson.loads(TOOLS_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def save_cached_tools(tools_response: Dict[str, Any]):
+    """Write the tools/list response to the on-disk cache, ignoring failures"""
+    try:
+        TOOLS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        TOOLS_CACHE_PATH.write_bytes(orjson.dumps(tools_response))
+    except OSError:
+        pass
 
 def main():
     client = TravelMcpClient()
@@ -245,54 +639,46 @@ def main():
     print("🌍 Travel & Content Search MCP Client")
     print("Connecting to server...")
     
-    # Test connection by listing tools
-    tools_response = client.list_tools()
-    if "error" in tools_response:
-        print(f"❌ Failed to connect to server: {tools_response['error']}")
+    # Test connection by listing tools, or with a lightweight probe when the tool list is cached
+    tools_response = load_cached_tools()
+    if tools_response is None:
+        tools_response = client.list_tools()
+        connection = tools_response
+    else:
+        connection = client.ping()
+    if "error" in connection:
+        print(f"❌ Failed to connect to server: {connection['error']}")
         print("Make sure the MCP server is running on http://localhost:8080")
         return
+    if connection is tools_response:
+        save_cached_tools(tools_response)
     
     print("✅ Connected successfully!")
     
     while True:
         try:
             display_menu()
-            choice = input("\nEnter your choice (1-7): ").strip()
+            choice = input(f"\nEnter your choice (1-{LAST_CHOICE}): ").strip()
             
-            if choice == "1":
-                handle_flight_search(client)
-            elif choice == "2":
-                handle_hotel_search(client)
-            elif choice == "3":
-                handle_restaurant_search(client)
-            elif choice == "4":
-                handle_attraction_search(client)
-            elif choice == "5":
-                handle_youtube_search(client)
-            elif choice == "6":
-                print("\n🔧 Available Tools:")
-                print("-" * 50)
-                if "result" in tools_response and "tools" in tools_response["result"]:
-                    for i, tool in enumerate(tools_response["result"]["tools"], 1):
-                        print(f"{i}. {tool['name']}")
-                        print(f"   Description: {tool['description']}")
-                        print()
-                else:
-                    print(f"❌ Error listing tools: {tools_response}")
-            elif choice == "7":
+            entry = HANDLERS.get(choice)
+            if entry:
+                entry[0](client)
+            elif choice == LIST_TOOLS_CHOICE:
+                display_tools(tools_response)
+            elif choice == EXIT_CHOICE:
                 print("\n👋 Goodbye! Thanks for using Travel & Content Search MCP Client!")
                 break
             else:
-                print("\n❌ Invalid choice. Please enter 1-7.")
+                print(f"\n❌ Invalid choice. Please enter 1-{LAST_CHOICE}.")
                 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, EOFError):
             print("\n\n👋 Goodbye! Thanks for using Travel & Content Search MCP Client!")
             break
         except Exception as e:
             print(f"\n❌ Error: {e}")
             print("Please try again.")
 
-# Also keep backward compatibility
+# Backward-compatible alias for the former flight-only client
 FlightMcpClient = TravelMcpClient
 
 if __name__ == "__main__":
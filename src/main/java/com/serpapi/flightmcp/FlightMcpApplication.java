@@ -8,10 +8,14 @@ import org.springframework.boot.Banner;
 import org.springframework.boot.CommandLineRunner;
 import org.springframework.boot.SpringApplication;
 import org.springframework.boot.autoconfigure.SpringBootApplication;
+import org.springframework.http.ResponseEntity;
 import org.springframework.web.bind.annotation.*;
 
 import java.io.BufferedReader;
 import java.io.InputStreamReader;
+import java.util.ArrayList;
+import java.util.LinkedHashMap;
+import java.util.List;
 import java.util.Map;
 
 /**
@@ -58,15 +62,83 @@ public class FlightMcpApplication implements CommandLineRunner {
 
     /**
      * Handles MCP protocol requests via HTTP POST.
+     * Accepts either a single JSON-RPC request or a JSON-RPC 2.0 batch (array of requests).
      * 
-     * @param request The MCP request body containing method and parameters
-     * @return Response map with results or error information
+     * @param request The MCP request body containing method and parameters, or a list of them
+     * @return Response map with results or error information, or a list of responses for a batch
      */
     @PostMapping("/mcp")
-    public Map<String, Object> handleMcpRequest(@RequestBody Map<String, Object> request) {
+    @SuppressWarnings("unchecked")
+    public ResponseEntity<Object> handleMcpRequest(@RequestBody Object request) {
+        if (request instanceof Map<?, ?> single) {
+            return ResponseEntity.ok(handleSingleRequest((Map<String, Object>) single));
+        }
+        if (!(request instanceof List<?> batch)) {
+            logger.warn("Rejecting MCP request with a non-object body");
+            return ResponseEntity.badRequest().body(invalidRequestError());
+        }
+        if (batch.isEmpty()) {
+            logger.warn("Rejecting empty MCP batch request");
+            return ResponseEntity.ok(invalidRequestError());
+        }
+        
+        logger.info("Received MCP batch request with {} calls", batch.size());
+        List<Map<String, Object>> responses = new ArrayList<>();
+        for (Object call : batch) {
+            if (!(call instanceof Map)) {
+                logger.warn("Invalid entry in MCP batch request");
+                responses.add(invalidRequestError());
+                continue;
+            }
+            Map<String, Object> entry = (Map<String, Object>) call;
+            if (!(entry.get("method") instanceof String)) {
+                logger.warn("MCP batch entry without a method");
+                responses.add(errorResponse(entry.get("id"), -32600, "Invalid Request"));
+                continue;
+            }
+            // One failing call must not fail the rest of the batch
+            try {
+                Map<String, Object> response = handleSingleRequest(entry);
+                if (response != null) {
+                    responses.add(response);
+                }
+            } catch (RuntimeException e) {
+                logger.error("Failed to handle MCP batch entry {}: {}", entry.get("method"), e.getMessage(), e);
+                responses.add(errorResponse(entry.get("id"), -32603, "Internal error: " + e.getMessage()));
+            }
+        }
+        // A batch made only of notifications gets no response body
+        return responses.isEmpty() ? ResponseEntity.ok().build() : ResponseEntity.ok(responses);
+    }
+
+    private Map<String, Object> handleSingleRequest(Map<String, Object> request) {
         logger.info("Received MCP request: {}", request.get("method"));
         Map<String, Object> response = mcpServer.handleRequest(request);
-        logger.debug("Sending MCP response: {}", response.containsKey("error") ? "ERROR" : "SUCCESS");
+        if (response != null) {
+            logger.debug("Sending MCP response: {}", response.containsKey("error") ? "ERROR" : "SUCCESS");
+        }
+        return response;
+    }
+
+    /**
+     * Builds a JSON-RPC 2.0 Invalid Request error. The id is null because it cannot be read
+     * from an invalid request.
+     */
+    private static Map<String, Object> invalidRequestError() {
+        return errorResponse(null, -32600, "Invalid Request");
+    }
+
+    /**
+     * Builds a JSON-RPC 2.0 error response. Unlike Map.of, allows a null id.
+     */
+    private static Map<String, Object> errorResponse(Object id, int code, String message) {
+        Map<String, Object> response = new LinkedHashMap<>();
+        response.put("jsonrpc", "2.0");
+        response.put("id", id);
+        response.put("error", Map.of(
+            "code", code,
+            "message", message
+        ));
         return response;
     }
 
@@ -0,0 +1,97 @@
+package com.serpapi.flightmcp;
+
+import com.serpapi.flightmcp.server.McpServer;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.WebMvcTest;
+import org.springframework.boot.test.mock.mockito.MockBean;
+import org.springframework.http.MediaType;
+import org.springframework.test.web.servlet.MockMvc;
+
+import java.util.Map;
+
+import static org.hamcrest.Matchers.nullValue;
+import static org.mockito.ArgumentMatchers.anyMap;
+import static org.mockito.Mockito.when;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+/**
+ * Tests for the HTTP MCP endpoint, covering single requests and JSON-RPC batches.
+ */
+@WebMvcTest(controllers = FlightMcpApplication.class)
+class FlightMcpApplicationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @MockBean
+    private McpServer mcpServer;
+
+    @BeforeEach
+    void setUp() {
+        when(mcpServer.handleRequest(anyMap())).thenAnswer(invocation -> {
+            Map<String, Object> request = invocation.getArgument(0);
+            if ("boom".equals(request.get("method"))) {
+                throw new IllegalStateException("tool failed");
+            }
+            return Map.of("jsonrpc", "2.0", "id", request.get("id"), "result", Map.of("ok", true));
+        });
+    }
+
+    @Test
+    void singleRequestReturnsResponseObject() throws Exception {
+        mockMvc.perform(post("/mcp")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("{\"jsonrpc\":\"2.0\",\"id\":1,\"method\":\"tools/list\"}"))
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.id").value(1))
+            .andExpect(jsonPath("$.result.ok").value(true));
+    }
+
+    @Test
+    void mixedBatchReturnsOneResponsePerEntry() throws Exception {
+        String batch = """
+            [
+              {"jsonrpc": "2.0", "id": 1, "method": "tools/list"},
+              {"jsonrpc": "2.0", "id": 2, "method": "boom"},
+              42,
+              {"jsonrpc": "2.0", "id": 3}
+            ]
+            """;
+
+        mockMvc.perform(post("/mcp")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(batch))
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.length()").value(4))
+            .andExpect(jsonPath("$[0].id").value(1))
+            .andExpect(jsonPath("$[0].result.ok").value(true))
+            .andExpect(jsonPath("$[1].id").value(2))
+            .andExpect(jsonPath("$[1].error.code").value(-32603))
+            .andExpect(jsonPath("$[2].id").value(nullValue()))
+            .andExpect(jsonPath("$[2].error.code").value(-32600))
+            .andExpect(jsonPath("$[3].id").value(3))
+            .andExpect(jsonPath("$[3].error.code").value(-32600));
+    }
+
+    @Test
+    void emptyBatchReturnsSingleInvalidRequestError() throws Exception {
+        mockMvc.perform(post("/mcp")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("[]"))
+            .andExpect(status().isOk())
+            .andExpect(jsonPath("$.error.code").value(-32600));
+    }
+
+    @Test
+    void scalarBodyIsRejected() throws Exception {
+        mockMvc.perform(post("/mcp")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("42"))
+            .andExpect(status().isBadRequest())
+            .andExpect(jsonPath("$.error.code").value(-32600));
+    }
+}